@@ -3,11 +3,21 @@ Python Decorators Examples
 Comprehensive examples of decorators in Python
 """
 
+import math
 import time
+import random
 import functools
+import inspect
 from datetime import datetime
 from typing import Callable, Any
 import logging
+from collections import deque
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; without it njit is a no-op
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -47,16 +57,36 @@ def greet(name):
 print(greet.__name__)  # greet (preserved)
 print(greet.__doc__)   # Greets a person by name (preserved)
 
+# functools.wraps copies __module__, __name__, __qualname__, __doc__,
+# __annotations__ and __dict__ and sets __wrapped__, looking each one up
+# through getattr with a fallback. When a decorator is applied to many
+# functions at import time, assigning them directly is cheaper. Attributes
+# in func.__dict__ (e.g. memoize's cache_info) are still forwarded, so
+# stacked decorators keep working; only __annotations__ is skipped.
+def _fast_wraps(wrapper, func):
+    """Copy the commonly needed metadata from func onto wrapper"""
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__dict__.update(func.__dict__)
+    wrapper.__wrapped__ = func
+    return wrapper
+
 # 3. Timing Decorator
 def timer(func):
     """Decorator to measure function execution time"""
+    # Resolve per-function lookups once, at decoration time
+    name = func.__name__
+    clock = time.perf_counter_ns  # monotonic, integer nanoseconds
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = clock()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        print(f"{func.__name__} took {execution_time:.4f} seconds to execute")
+        end_ns = clock()
+        execution_time = (end_ns - start_ns) / 1e9
+        print(f"{name} took {execution_time:.4f} seconds to execute")
         return result
     return wrapper
 
@@ -72,12 +102,22 @@ result = slow_function()
 def repeat(times):
     """Decorator that repeats function execution"""
     def decorator(func):
-        @functools.wraps(func)
+        if isinstance(times, int) and 1 <= times <= 8:
+            # Small counts: generate a wrapper with the calls unrolled,
+            # so no loop runs on each call
+            calls = "\n".join(["    result = func(*args, **kwargs)"] * times)
+            source = f"def wrapper(*args, **kwargs):\n{calls}\n    return result\n"
+            # Name the code after the decorator so tracebacks stay readable
+            code = compile(source, f"<repeat({times}) wrapper of {func.__qualname__}>", "exec")
+            namespace = {}
+            exec(code, {"__name__": func.__module__, "func": func}, namespace)
+            return _fast_wraps(namespace["wrapper"], func)
+
         def wrapper(*args, **kwargs):
             for i in range(times):
                 result = func(*args, **kwargs)
             return result
-        return wrapper
+        return _fast_wraps(wrapper, func)
     return decorator
 
 @repeat(3)
@@ -89,30 +129,35 @@ say_hi()  # Prints "Hi!" three times
 # 5. Retry Decorator
 def retry(max_attempts=3, delay=1):
     """Decorator that retries function execution on failure"""
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
     def decorator(func):
+        sleep = time.sleep
+        retries = max_attempts - 1
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_attempts):
+            # Every attempt but the last sleeps and retries on failure
+            for attempt in range(retries):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
-                        time.sleep(delay)
-                    else:
-                        print(f"All {max_attempts} attempts failed.")
+                    print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
+                    sleep(delay)
             
-            raise last_exception
+            # Final attempt: let the exception propagate with its traceback
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                print(f"All {max_attempts} attempts failed.")
+                raise
         return wrapper
     return decorator
 
 @retry(max_attempts=3, delay=0.5)
 def unreliable_function():
     """Function that fails randomly"""
-    import random
     if random.random() < 0.7:  # 70% chance of failure
         raise Exception("Random failure!")
     return "Success!"
@@ -121,21 +166,27 @@ def unreliable_function():
 def log_calls(level=logging.INFO):
     """Decorator that logs function calls"""
     def decorator(func):
+        name = func.__name__
+        is_enabled = logger.isEnabledFor
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            args_str = ', '.join(map(str, args))
-            kwargs_str = ', '.join(f"{k}={v}" for k, v in kwargs.items())
-            all_args = ', '.join(filter(None, [args_str, kwargs_str]))
-            
-            logger.log(level, f"Calling {func.__name__}({all_args})")
+            # Only build the argument string if the message will be emitted
+            enabled = is_enabled(level)
+            if enabled:
+                all_args = ', '.join([*map(str, args),
+                                      *(f"{k}={v}" for k, v in kwargs.items())])
+                logger.log(level, "Calling %s(%s)", name, all_args)
             
             try:
                 result = func(*args, **kwargs)
-                logger.log(level, f"{func.__name__} returned: {result}")
-                return result
             except Exception as e:
-                logger.error(f"{func.__name__} raised {type(e).__name__}: {e}")
+                logger.error("%s raised %s: %s", name, type(e).__name__, e)
                 raise
+            
+            if enabled:
+                logger.log(level, "%s returned: %s", name, result)
+            return result
         return wrapper
     return decorator
 
@@ -147,27 +198,51 @@ def calculate_area(length, width):
 area = calculate_area(5, 3)
 
 # 7. Validation Decorator
+def _type_checker(func, expected_types):
+    """Build a validate(args, kwargs) function for func's argument types"""
+    # Inspect the signature once, not on every call
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    checks = [(name, expected_types[name]) for name in sig.parameters
+              if name in expected_types]
+    positional_checks = [(index, param.name, expected_types[param.name])
+                         for index, param in enumerate(params)
+                         if param.name in expected_types]
+    all_positional = all(
+        param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        for param in params
+    )
+
+    def check(param_name, expected_type, value):
+        if not isinstance(value, expected_type):
+            raise TypeError(
+                f"{param_name} must be {expected_type.__name__}, "
+                f"got {type(value).__name__}"
+            )
+
+    def validate(args, kwargs):
+        if all_positional and not kwargs and len(args) == len(params):
+            # Fast path: every argument was passed positionally
+            for index, param_name, expected_type in positional_checks:
+                check(param_name, expected_type, args[index])
+        else:
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            arguments = bound_args.arguments
+            for param_name, expected_type in checks:
+                if param_name in arguments:
+                    check(param_name, expected_type, arguments[param_name])
+
+    return validate
+
 def validate_types(**expected_types):
     """Decorator that validates function argument types"""
     def decorator(func):
+        validate = _type_checker(func, expected_types)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function signature
-            import inspect
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            
-            # Validate types
-            for param_name, expected_type in expected_types.items():
-                if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
-                    if not isinstance(value, expected_type):
-                        raise TypeError(
-                            f"{param_name} must be {expected_type.__name__}, "
-                            f"got {type(value).__name__}"
-                        )
-            
+            validate(args, kwargs)
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -184,19 +259,29 @@ user = create_user("John", 30, "john@example.com")
 def memoize(func):
     """Decorator that caches function results"""
     cache = {}
+    kwargs_mark = object()  # separates positional args from kwargs in keys
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Create cache key
-        key = str(args) + str(sorted(kwargs.items()))
+        # Use the (hashable) arguments themselves as the cache key
+        key = args if not kwargs else args + (kwargs_mark,) + tuple(sorted(kwargs.items()))
         
-        if key not in cache:
-            print(f"Computing {func.__name__}{args}")
-            cache[key] = func(*args, **kwargs)
+        try:
+            result = cache[key]
+        except (KeyError, TypeError) as e:
+            # TypeError: unhashable arguments (lists, dicts...) can't be cached
+            cacheable = isinstance(e, KeyError)
         else:
             print(f"Cache hit for {func.__name__}{args}")
+            return result
         
-        return cache[key]
+        # Call func outside the except block so its own exceptions aren't
+        # chained to the cache miss
+        if not cacheable:
+            return func(*args, **kwargs)
+        print(f"Computing {func.__name__}{args}")
+        result = cache[key] = func(*args, **kwargs)
+        return result
     
     # Add cache management methods
     wrapper.cache = cache
@@ -206,6 +291,18 @@ def memoize(func):
     return wrapper
 
 @memoize
+def square(n):
+    """Square a number (demonstrates the hand-rolled cache)"""
+    return n * n
+
+print(square(4))  # Computed
+print(square(4))  # Cache hit
+print(square.cache_info())
+
+# For real workloads prefer functools.lru_cache: its wrapper is implemented in C
+# and hashes the arguments tuple directly instead of building a string key.
+# Keyword arguments are folded into that tuple (in call order, not sorted).
+@functools.lru_cache(maxsize=None)
 def fibonacci(n):
     """Calculate fibonacci number (expensive recursive version)"""
     if n < 2:
@@ -214,20 +311,35 @@ def fibonacci(n):
 
 print(fibonacci(10))  # Computed
 print(fibonacci(10))  # Cache hit
-print(fibonacci.cache_info())
+print(fibonacci.cache_info())  # CacheInfo(hits=..., misses=..., maxsize=None, currsize=...)
+
+# Numba compiles pure numeric kernels like this to machine code. The explicit
+# signature compiles at import time and cache=True keeps the result on disk.
+# Tiny functions (e.g. add_numbers below) are poor targets: dispatch dominates.
+@njit('int64(int64)', cache=True)
+def fibonacci_native(n):
+    """Uncached recursive fibonacci, JIT-compiled when Numba is installed"""
+    if n < 2:
+        return n
+    return fibonacci_native(n - 1) + fibonacci_native(n - 2)
+
+print(fibonacci_native(25))
 
 # 9. Rate Limiting Decorator
 def rate_limit(max_calls, time_window):
     """Decorator that limits function call rate"""
-    calls = []
+    calls = deque()
+    # Monotonic clock: wall-clock adjustments can't shift the window
+    window_ns = int(time_window * 1_000_000_000)
     
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            now = time.time()
+            now = time.monotonic_ns()
             
-            # Remove old calls outside time window
-            calls[:] = [call_time for call_time in calls if now - call_time < time_window]
+            # Drop expired calls from the front (oldest first)
+            while calls and now - calls[0] >= window_ns:
+                calls.popleft()
             
             if len(calls) >= max_calls:
                 raise Exception(f"Rate limit exceeded: {max_calls} calls per {time_window} seconds")
@@ -245,16 +357,23 @@ def api_call():
 # 10. Class-based Decorator
 class CountCalls:
     """Class-based decorator that counts function calls"""
+    # No per-instance __dict__: every attribute is a slot. __doc__ can't be
+    # a slot next to the class docstring, so the wrapped function's
+    # docstring is not forwarded (it's still on __wrapped__.__doc__).
+    __slots__ = ('func', 'count', '__wrapped__', '__name__', '__qualname__')
     
     def __init__(self, func):
         self.func = func
         self.count = 0
-        functools.update_wrapper(self, func)
+        functools.update_wrapper(self, func,
+                                 assigned=('__name__', '__qualname__'),
+                                 updated=())
     
     def __call__(self, *args, **kwargs):
+        func = self.func
         self.count += 1
         print(f"Call {self.count} of {self.func.__name__}")
-        return self.func(*args, **kwargs)
+        return func(*args, **kwargs)
     
     def reset_count(self):
         self.count = 0
@@ -293,13 +412,11 @@ class Circle:
     @property
     def area(self):
         """Calculate area (read-only property)"""
-        import math
         return math.pi * self._radius ** 2
     
     @property
     def circumference(self):
         """Calculate circumference (read-only property)"""
-        import math
         return 2 * math.pi * self._radius
     
     @staticmethod
@@ -324,13 +441,13 @@ from contextlib import contextmanager
 @contextmanager
 def timer_context():
     """Context manager for timing code blocks"""
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     print("Timer started")
     try:
-        yield start
+        yield time.time()  # wall-clock start, as seconds since the epoch
     finally:
-        end = time.time()
-        print(f"Timer ended. Elapsed: {end - start:.4f} seconds")
+        end_ns = time.perf_counter_ns()
+        print(f"Timer ended. Elapsed: {(end_ns - start_ns) / 1e9:.4f} seconds")
 
 # Usage
 with timer_context():
@@ -367,20 +484,63 @@ def multiply(x, y):
 
 result = multiply(4, 5)
 
+# Every stacked decorator adds a wrapper frame and repacks *args/**kwargs.
+# For a hot function the stack can be fused into one wrapper that does the
+# same work (timing, logging, validation) in a single frame.
+def timed_logged_validated(level=logging.INFO, **expected_types):
+    """Fused equivalent of @timer @log_calls(level) @validate_types(...)"""
+    def decorator(func):
+        name = func.__name__
+        validate = _type_checker(func, expected_types)
+        clock = time.perf_counter_ns
+        is_enabled = logger.isEnabledFor
+
+        def wrapper(*args, **kwargs):
+            start_ns = clock()
+            enabled = is_enabled(level)
+            if enabled:
+                all_args = ', '.join([*map(str, args),
+                                      *(f"{k}={v}" for k, v in kwargs.items())])
+                logger.log(level, "Calling %s(%s)", name, all_args)
+            
+            try:
+                validate(args, kwargs)
+                result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s raised %s: %s", name, type(e).__name__, e)
+                raise
+            
+            if enabled:
+                logger.log(level, "%s returned: %s", name, result)
+            execution_time = (clock() - start_ns) / 1e9
+            print(f"{name} took {execution_time:.4f} seconds to execute")
+            return result
+        return _fast_wraps(wrapper, func)
+    return decorator
+
+@timed_logged_validated(x=int, y=int)
+def multiply_fused(x, y):
+    """Multiply two numbers with a single fused decorator"""
+    return x * y
+
+result = multiply_fused(4, 5)
+
 # 15. Decorator with State
 def stateful_decorator():
     """Decorator that maintains state across calls"""
     state = {"calls": 0, "total_time": 0}
     
     def decorator(func):
+        clock = time.perf_counter_ns
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = clock()
             result = func(*args, **kwargs)
-            end_time = time.time()
+            end_ns = clock()
             
             state["calls"] += 1
-            state["total_time"] += (end_time - start_time)
+            state["total_time"] += (end_ns - start_ns) / 1e9
             
             print(f"Call #{state['calls']}, "
                   f"Average time: {state['total_time']/state['calls']:.4f}s")